@@ -26,6 +26,7 @@ from .device_bank_navigation import DeviceBankNavigationComponent
 from .elements import NUM_TRACKS, Elements
 from .mappings import create_mappings
 from .mixer import MixerComponent
+from .profiling import Profiler, ProfilerComponent
 from .view_control import ViewControlComponent
 
 logger = logging.getLogger(__name__)
@@ -101,12 +102,19 @@ class Specification(ControlSurfaceSpecification):
     component_map = {
         "Device": _create_device_component,
         "Mixer": MixerComponent,
+        "Profiler": ProfilerComponent,
         "View_Control": ViewControlComponent,
     }
 
 
 class iRift(ControlSurface):
     def __init__(self, *a, **k):
+        # Needs to exist before the dependency injector gets built
+        # during the base initialization.
+        self._profiler = Profiler(
+            duration=_configuration.profiling_duration,
+            show_message=self.show_message,
+        )
         super().__init__(*a, specification=Specification, **k)
 
     def setup(self):
@@ -127,6 +135,7 @@ class iRift(ControlSurface):
         )
 
         deps["configuration"] = const(_configuration)
+        deps["profiler"] = const(self._profiler)
         deps["specification"] = const(self.specification)
 
         return deps
@@ -139,6 +148,22 @@ class iRift(ControlSurface):
         with inject(configuration=const(_configuration)).everywhere():
             return super(iRift, iRift)._create_elements(specification)
 
+    def receive_midi(self, midi_bytes):
+        with self._profiler.capturing():
+            super().receive_midi(midi_bytes)
+
+    def update_display(self):
+        self._profiler.update()
+        with self._profiler.capturing():
+            super().update_display()
+
+    def disconnect(self):
+        # Write out any in-progress capture.
+        try:
+            self._profiler.stop()
+        finally:
+            super().disconnect()
+
     def _do_send_midi(self, midi_event_bytes):
         # The iRig only handles program changes (0xC*) messages
         # (0xF*). Everything else is ignored by the controller, except
@@ -46,6 +46,13 @@ class Configuration(typing.NamedTuple):
     # For example, set this to 6 to select the U01 preset on startup.
     initial_program: typing.Optional[int] = None
 
+    # If enabled, pad 8 on the data encoder mode MIDI channel starts
+    # (or stops) a cProfile capture of MIDI handling and update
+    # ticks. The stats are written to a .pstats file next to Live's
+    # Log.txt after the given number of seconds.
+    profiling_enabled: bool = False
+    profiling_duration: float = 10.0
+
 
 def get_configuration() -> Configuration:
     # Load a local configuration if possible, or fall back to the default.
@@ -34,7 +34,13 @@ def create_mappings(
 
     # Get modes assigning buttons to select the data encoder mode. The
     # parameter is a list of element names for the 8 pads (in order).
-    def data_encoder_pad_modes(buttons: typing.List[str]):
+    #
+    # If `profiler_button` is set, the last pad toggles profiling
+    # rather than returning to the default pad mode. This only makes
+    # sense where the default pad mode is already active.
+    def data_encoder_pad_modes(
+        buttons: typing.List[str], profiler_button: bool = False
+    ):
         return [
             dict(
                 component="Data_Encoder_Modes",
@@ -47,6 +53,11 @@ def create_mappings(
                 enable_drum_group_button=buttons[6],
             ),
             dict(
+                component="Profiler",
+                toggle_button=buttons[7],
+            )
+            if profiler_button
+            else dict(
                 component="Pad_Modes",
                 default_button=buttons[7],
             ),
@@ -85,7 +96,8 @@ def create_mappings(
             tap_tempo_button="transport_buttons_raw[5]",
         ),
         *data_encoder_pad_modes(
-            [f"data_encoder_mode_buttons_raw[{i}]" for i in range(NUM_TRACKS)]
+            [f"data_encoder_mode_buttons_raw[{i}]" for i in range(NUM_TRACKS)],
+            profiler_button=configuration.profiling_enabled,
         ),
     ]
     mappings["Pad_Modes"] = dict(
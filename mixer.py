@@ -1,6 +1,12 @@
 import typing
+from contextlib import ExitStack, contextmanager
 
+# currently no v3 equivalent
+from ableton.v2.base import liveobj_changed, liveobj_valid
 from ableton.v3.base import depends
+from ableton.v3.control_surface.components import (
+    ChannelStripComponent as ChannelStripComponentBase,
+)
 from ableton.v3.control_surface.components import (
     MixerComponent as MixerComponentBase,
 )
@@ -49,12 +55,62 @@ class SendIndexScrollable(Scrollable):
         )
 
 
+# Get the position of a (valid) track in the list of tracks, skipping
+# positions that have already been claimed by another strip.
+def _find_track_index(track, tracks, claimed_strips) -> typing.Optional[int]:
+    if not liveobj_valid(track):
+        return None
+    for index, other_track in enumerate(tracks):
+        if claimed_strips[index] is None and not liveobj_changed(track, other_track):
+            return index
+    return None
+
+
+def _element_at(elements, index):
+    return elements[index] if index < len(elements) else None
+
+
+class ChannelStripComponent(ChannelStripComponentBase):
+    def __init__(self, *a, **k):
+        self._is_deferring_updates = False
+        self._has_deferred_update = False
+        super().__init__(*a, **k)
+
+    # Hold back component updates while the mixer is reassigning
+    # tracks, and perform at most one update once the reassignment is
+    # done. Note that this doesn't affect feedback sent directly by
+    # the strip's controls.
+    @contextmanager
+    def deferring_updates(self):
+        self._is_deferring_updates = True
+        try:
+            yield
+        finally:
+            self._is_deferring_updates = False
+            if self._has_deferred_update:
+                self._has_deferred_update = False
+                self.update()
+
+    def update(self):
+        if self._is_deferring_updates:
+            self._has_deferred_update = True
+            return
+        super().update()
+
+
 class MixerComponent(MixerComponentBase):
     @depends(show_message=None)
     def __init__(
         self, *a, show_message: typing.Optional[typing.Callable[[str], typing.Any]], **k
     ):
-        super().__init__(*a, **k)
+        # Control elements assigned to the strips, by strip control
+        # name. Strips get reordered when the session ring moves, so
+        # we need to be able to re-point these at the new order. The
+        # base constructor performs an initial track assignment, so
+        # this needs to exist beforehand.
+        self._strip_control_elements: typing.Dict[str, typing.List[typing.Any]] = {}
+
+        super().__init__(*a, channel_strip_component_type=ChannelStripComponent, **k)
         assert show_message
         self._show_message = show_message
 
@@ -63,6 +119,32 @@ class MixerComponent(MixerComponentBase):
             parent=self, scrollable=send_index_scrollable
         )
 
+    # Strip controls need to be tracked here, rather than assigned via
+    # the base component, so that they follow the strips when they get
+    # reordered. This list needs to cover every per-strip Mixer control
+    # used in `mappings.py`, otherwise that control will end up
+    # driving the wrong track after scrolling.
+    def set_mute_buttons(self, buttons):
+        self._set_strip_control_elements("mute_button", buttons)
+
+    def set_solo_buttons(self, buttons):
+        self._set_strip_control_elements("solo_button", buttons)
+
+    def set_arm_buttons(self, buttons):
+        self._set_strip_control_elements("arm_button", buttons)
+
+    def set_track_select_buttons(self, buttons):
+        self._set_strip_control_elements("track_select_button", buttons)
+
+    def set_volume_controls(self, controls):
+        self._set_strip_control_elements("volume_control", controls)
+
+    def set_pan_controls(self, controls):
+        self._set_strip_control_elements("pan_control", controls)
+
+    def set_send_controls(self, controls):
+        self._set_strip_control_elements("send_control", controls)
+
     def set_selected_track_arm_button(self, button):
         self._target_strip.arm_button.set_control_element(button)
         self._target_strip.update()
@@ -70,6 +152,85 @@ class MixerComponent(MixerComponentBase):
     def set_send_index_encoder(self, encoder):
         self._send_index_scroll.scroll_encoder.set_control_element(encoder)
 
+    def _set_strip_control_elements(self, name, elements):
+        elements = list(elements or [])
+        self._strip_control_elements[name] = elements
+        for index, strip in enumerate(self._channel_strips):
+            getattr(strip, name).set_control_element(_element_at(elements, index))
+
+    def _reassign_tracks(self):
+        # The standard implementation calls `set_track` on every strip
+        # whenever the session ring moves, which detaches and
+        # re-attaches all listeners on all strips. Instead, strips stay
+        # attached to their tracks while those tracks remain in the
+        # window, and are just moved to their new position (along with
+        # the control elements for that position). Only strips whose
+        # track left the window get a new track.
+        #
+        # Moves by a full page or more have no tracks in common with
+        # the previous window, so every non-empty strip still gets a
+        # new track in that case.
+        previous_strips = list(self._channel_strips)
+        num_strips = len(previous_strips)
+        tracks = (list(self._session_ring.tracks) + [None] * num_strips)[:num_strips]
+
+        strips: typing.List[typing.Any] = [None] * num_strips
+        free_strips = []
+        for strip in previous_strips:
+            index = _find_track_index(strip.track, tracks, strips)
+            if index is None:
+                free_strips.append(strip)
+            else:
+                strips[index] = strip
+
+        # Prefer keeping free strips at their current position, to
+        # avoid re-pointing control elements unnecessarily.
+        reassignments = []
+        for index, track in enumerate(tracks):
+            if strips[index] is not None:
+                continue
+            strip = previous_strips[index]
+            if strip not in free_strips:
+                strip = free_strips[0]
+            free_strips.remove(strip)
+            strips[index] = strip
+            if liveobj_changed(track, strip.track):
+                reassignments.append((strip, track))
+
+        moved_strips = [
+            (index, strip)
+            for index, strip in enumerate(strips)
+            if strip is not previous_strips[index]
+        ]
+        if not reassignments and not moved_strips:
+            return
+
+        touched_strips = [strip for strip, _ in reassignments]
+        touched_strips.extend(
+            strip for _, strip in moved_strips if strip not in touched_strips
+        )
+        with ExitStack() as stack:
+            for strip in touched_strips:
+                stack.enter_context(strip.deferring_updates())
+
+            # Release all moved strips' elements before assigning the
+            # new ones. Otherwise, a strip releasing its previous
+            # element (e.g. unmapping a parameter) could clobber the
+            # assignment that another strip just made to it.
+            for name in self._strip_control_elements:
+                for _, strip in moved_strips:
+                    getattr(strip, name).set_control_element(None)
+
+            self._channel_strips[:] = strips
+            for strip, track in reassignments:
+                strip.set_track(track)
+
+            for name, elements in self._strip_control_elements.items():
+                for index, strip in moved_strips:
+                    getattr(strip, name).set_control_element(
+                        _element_at(elements, index)
+                    )
+
     def _on_send_index_changed(self):
         self._show_message(f"Controlling Send {self.send_index+ 1}")
         return super()._on_send_index_changed()
@@ -0,0 +1,141 @@
+import cProfile
+import Live
+import logging
+import os
+import pstats
+import sys
+import tempfile
+import time
+import typing
+from contextlib import contextmanager
+
+from ableton.v3.base import depends
+from ableton.v3.control_surface import Component
+from ableton.v3.control_surface.controls import ButtonControl
+
+logger = logging.getLogger(__name__)
+
+
+def _get_log_directory() -> str:
+    # Live writes its `Log.txt` to its preferences folder, which isn't
+    # exposed to scripts, so we reconstruct the path from the app
+    # version. Fall back to the temp directory if it can't be found.
+    application = Live.Application.get_application()
+    version = ".".join(
+        str(v)
+        for v in (
+            application.get_major_version(),
+            application.get_minor_version(),
+            application.get_bugfix_version(),
+        )
+    )
+    if sys.platform == "darwin":
+        directory = os.path.expanduser(
+            os.path.join("~", "Library", "Preferences", "Ableton", f"Live {version}")
+        )
+    else:
+        directory = os.path.join(
+            os.environ.get("APPDATA", ""), "Ableton", f"Live {version}", "Preferences"
+        )
+
+    return directory if os.path.isdir(directory) else tempfile.gettempdir()
+
+
+class Profiler:
+    def __init__(
+        self, duration: float, show_message: typing.Callable[[str], typing.Any]
+    ):
+        self._duration = duration
+        self._show_message = show_message
+        self._profile: typing.Optional[cProfile.Profile] = None
+        self._start_time = 0.0
+        self._num_captures = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._profile is not None
+
+    def start(self):
+        if self.is_running:
+            return
+        self._profile = cProfile.Profile()
+        self._start_time = time.monotonic()
+        self._show_message(f"Profiling for {self._duration:g} seconds")
+        logger.info("started profiling")
+
+    def stop(self):
+        profile = self._profile
+        if profile is None:
+            return
+        self._profile = None
+        # We might be called from within a capture (e.g. when stopped
+        # from the controller), so make sure the profiler's own
+        # bookkeeping below doesn't end up in the stats.
+        profile.disable()
+
+        # Include milliseconds and a per-session counter, so that
+        # quick successive captures don't overwrite each other.
+        self._num_captures += 1
+        now = time.time()
+        timestamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now))
+        milliseconds = int(now * 1000) % 1000
+        path = os.path.join(
+            _get_log_directory(),
+            f"iRift-{timestamp}.{milliseconds:03d}-{self._num_captures}.pstats",
+        )
+        try:
+            stats = pstats.Stats(profile)
+        except TypeError:
+            # Raised if nothing was captured.
+            self._show_message("Profiling stopped, nothing was captured")
+            return
+        try:
+            stats.dump_stats(path)
+        except OSError as e:
+            logger.error(f"failed to write profile to {path}: {e}")
+            self._show_message(f"Profiling failed, couldn't write {path}")
+            return
+
+        message = (
+            f"Profiled {stats.total_calls} calls in {stats.total_tt:.3f}s, "
+            f"saved to {path}"
+        )
+        self._show_message(message)
+        logger.info(message)
+
+    # Called on each update tick to end the capture once the duration
+    # has elapsed.
+    def update(self):
+        if self.is_running and time.monotonic() - self._start_time >= self._duration:
+            self.stop()
+
+    # Capture the wrapped work if profiling is active.
+    @contextmanager
+    def capturing(self):
+        profile = self._profile
+        if profile is None:
+            yield
+            return
+
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+
+
+class ProfilerComponent(Component):
+    toggle_button = ButtonControl()
+
+    @depends(profiler=None)
+    def __init__(self, *a, profiler: typing.Optional[Profiler] = None, **k):
+        super().__init__(*a, **k)
+        assert profiler
+        self._profiler = profiler
+
+    @toggle_button.pressed
+    def toggle_button(self, _):
+        if self._profiler.is_running:
+            self._profiler.stop()
+        else:
+            self._profiler.start()